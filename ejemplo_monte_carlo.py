@@ -6,53 +6,53 @@
 Simula múltiples grafos y encuentra el peor escenario posible.
 """
 
-from bayesian_9d import generar_grafo_9d, analizar_horror, votar_modo, DIMENSIONES_9D
+from src.core.core_engine import generar_grafo_9d, analizar_horror, votar_modo, DIMENSIONES_9D
+from src.core.monte_carlo import simulacion_monte_carlo_streaming
 from colorama import Fore, Style, init
+from typing import Optional
+import argparse
 import numpy as np
 import json
 
 init(autoreset=True)
 
-def simulacion_monte_carlo(n_simulaciones: int = 100):
+def simulacion_monte_carlo(
+    n_simulaciones: int = 100,
+    workers: int = 1,
+    ci_width: Optional[float] = None,
+    checkpoint: Optional[str] = None
+):
     """
-    Ejecuta N simulaciones y retorna estadísticas.
+    Ejecuta hasta N simulaciones y retorna estadísticas.
+    Memoria constante: ver src/core/monte_carlo.py (Welford + P², IC, checkpoints).
     """
     print(f"{Fore.YELLOW}🎲 Ejecutando {n_simulaciones} simulaciones Monte Carlo...{Style.RESET_ALL}\n")
     
-    resultados = []
-    peor_caso = None
-    peor_horror = 0
+    resumen = simulacion_monte_carlo_streaming(
+        n_max=n_simulaciones,
+        workers=workers,
+        ci_width=ci_width,
+        checkpoint=checkpoint,
+        checkpoint_every=max(10, n_simulaciones // 10),
+        verbose=True,
+        ramificaciones_por_nodo=5
+    )
     
-    for i in range(n_simulaciones):
-        grafo = generar_grafo_9d(seed=i, ramificaciones_por_nodo=5)
-        analisis = analizar_horror(grafo, top_n=16)
-        
-        resultados.append({
-            'seed': i,
-            'horror_total': analisis['horror_total'],
-            'horror_promedio': analisis['horror_promedio']
-        })
-        
-        if analisis['horror_total'] > peor_horror:
-            peor_horror = analisis['horror_total']
-            peor_caso = {
-                'seed': i,
-                'analisis': analisis
-            }
-        
-        if (i + 1) % 10 == 0:
-            print(f"{Fore.CYAN}  Progreso: {i + 1}/{n_simulaciones}{Style.RESET_ALL}")
+    # Mismo seed → mismo universo: solo el peor caso se materializa
+    peor_seed = resumen['seed_max']
+    grafo = generar_grafo_9d(seed=peor_seed, ramificaciones_por_nodo=5)
     
-    # Calcular estadísticas
-    horrores = [r['horror_total'] for r in resultados]
     stats = {
-        'n_simulaciones': n_simulaciones,
-        'horror_min': min(horrores),
-        'horror_max': max(horrores),
-        'horror_media': np.mean(horrores),
-        'horror_mediana': np.median(horrores),
-        'horror_std': np.std(horrores),
-        'peor_caso': peor_caso
+        'n_simulaciones': resumen['n'],
+        'horror_min': resumen['horror_min'],
+        'horror_max': resumen['horror_max'],
+        'horror_media': resumen['horror_media'],
+        'horror_mediana': resumen['p50'],
+        'horror_std': resumen['horror_std'],
+        'peor_caso': {
+            'seed': peor_seed,
+            'analisis': analizar_horror(grafo, top_n=16)
+        }
     }
     
     return stats
@@ -91,7 +91,15 @@ if __name__ == "__main__":
     print(f"{Fore.CYAN}  Buscando el peor escenario posible...{Style.RESET_ALL}")
     print(f"{Fore.RED}{'═' * 70}{Style.RESET_ALL}\n")
     
-    stats = simulacion_monte_carlo(n_simulaciones=100)
+    parser = argparse.ArgumentParser(description="Simulación Monte Carlo de horror")
+    parser.add_argument("--n", type=int, default=100, help="máximo de simulaciones")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--ci-width", type=float, default=None,
+                        help="detener cuando el IC 95%% de la media sea más angosto que esto")
+    parser.add_argument("--checkpoint", default=None, help="JSON para retomar corridas largas")
+    args = parser.parse_args()
+    
+    stats = simulacion_monte_carlo(args.n, args.workers, args.ci_width, args.checkpoint)
     print_resultados(stats)
     
     # Exportar resultados